@@ -21,9 +21,7 @@ LOCK_FILE="/tmp/claude_merge.lock"
 # Cleanup function
 cleanup() {
     local exit_code=$?
-    if [[ -f "$LOCK_FILE" ]]; then
-        rm -f "$LOCK_FILE"
-    fi
+    rm -f "$LOCK_FILE"
     exit $exit_code
 }
 
@@ -143,12 +141,6 @@ update_system_script() {
     fi
 }
 
-# Find templates directory
-if ! TEMPLATES_DIR="$(find_templates_dir)"; then
-    echo -e "${RED}[ERROR]${NC} No valid templates directory found."
-    exit 1
-fi
-
 # Function to print colored output
 print_status() {
     echo -e "${BLUE}[INFO]${NC} $1"
@@ -164,17 +156,15 @@ print_error() {
 
 # Function to check if another instance is running
 check_lock() {
-    if [[ -f "$LOCK_FILE" ]]; then
-        local pid=$(cat "$LOCK_FILE" 2>/dev/null || echo "")
-        if [[ -n "$pid" ]] && kill -0 "$pid" 2>/dev/null; then
-            print_error "Another merge operation is already running (PID: $pid)"
-            exit 1
-        else
-            rm -f "$LOCK_FILE"
-        fi
+    # Read the lock directly - a missing file just yields an empty PID
+    local pid=""
+    read -r pid 2>/dev/null < "$LOCK_FILE" || true
+    if [[ -n "$pid" ]] && kill -0 "$pid" 2>/dev/null; then
+        print_error "Another merge operation is already running (PID: $pid)"
+        exit 1
     fi
     
-    # Create lock file with current PID
+    # Create lock file with current PID (replacing any stale one)
     echo $$ > "$LOCK_FILE"
 }
 
@@ -214,11 +204,9 @@ detect_and_clean_duplicates() {
         local template_file="$templates_dir/$rel_path"
         
         if [[ -f "$template_file" ]]; then
-            # Compare file content fingerprints
-            local claude_hash=$(sha256sum "$claude_file" 2>/dev/null | cut -d' ' -f1)
-            local template_hash=$(sha256sum "$template_file" 2>/dev/null | cut -d' ' -f1)
-            
-            if [[ "$claude_hash" == "$template_hash" ]]; then
+            # Compare content directly - cmp stops at the first differing byte
+            # (or on a size mismatch) instead of hashing both files in full
+            if cmp -s "$claude_file" "$template_file"; then
                 # Files are identical - remove from .claude (keep in templates)
                 rm -f "$claude_file"
                 ((cleaned_count++))
@@ -260,7 +248,7 @@ eliminate_enhanced_packages() {
         fi
         
         if [[ -n "$target_file" ]]; then
-            print_status "Merging $(basename "$enhanced_file") into $(basename "$target_file")"
+            print_status "Merging ${enhanced_file##*/} into ${target_file##*/}"
             
             # Append enhanced content to base file
             {
@@ -272,7 +260,7 @@ eliminate_enhanced_packages() {
             # Remove the enhanced file
             rm -f "$enhanced_file"
             ((eliminated_count++))
-            print_status "Eliminated: $(basename "$enhanced_file")"
+            print_status "Eliminated: ${enhanced_file##*/}"
         fi
     done
     
@@ -287,23 +275,21 @@ cleanup_old_backups() {
     local retention_hours="${CLAUDE_MERGE_BACKUP_RETENTION:-24}"
     local cleaned_count=0
     
+    # Backups stamped at or before this epoch second are past retention
+    local cutoff=$(( $(date +%s) - (retention_hours + 1) * 3600 ))
+    
     # Find and clean old backup files (with memory limits)
-    find "$target_dir" -maxdepth 3 -name "*.backup.*" -print0 2>/dev/null | head -c 1048576 | while IFS= read -r -d '' backup_file; do
+    while IFS= read -r -d '' backup_file; do
         if [[ -e "$backup_file" ]]; then
             # Extract timestamp from backup filename
-            local timestamp=$(echo "$backup_file" | sed 's/.*\.backup\.//')
-            if [[ "$timestamp" =~ ^[0-9]+$ ]]; then
-                local current_time=$(date +%s)
-                local age_hours=$(( (current_time - timestamp) / 3600 ))
-                
-                if [[ $age_hours -gt $retention_hours ]]; then
-                    rm -rf "$backup_file"
-                    ((cleaned_count++))
-                    print_status "Cleaned old backup: $(basename "$backup_file")"
-                fi
+            local timestamp="${backup_file##*.backup.}"
+            if [[ "$timestamp" =~ ^[0-9]+$ ]] && [[ $timestamp -le $cutoff ]]; then
+                rm -rf "$backup_file"
+                cleaned_count=$((cleaned_count + 1))
+                print_status "Cleaned old backup: ${backup_file##*/}"
             fi
         fi
-    done
+    done < <(find "$target_dir" -maxdepth 3 -name "*.backup.*" -print0 2>/dev/null | head -c 1048576)
     
     if [[ $cleaned_count -gt 0 ]]; then
         print_status "Cleaned $cleaned_count old backup files (older than ${retention_hours}h)"
@@ -316,26 +302,23 @@ cleanup_old_merge_backups() {
     local max_backups=5
     local cleaned_count=0
     
-    # Find CLAUDE.md backup files, sorted by timestamp (newest first) with memory limits
+    # Merge backups sit next to the CLAUDE.md they were taken from, so a glob
+    # of that directory finds them without walking the tree again
     local backup_files=()
-    find "$target_dir" -maxdepth 2 -name "CLAUDE.md.backup.*" -print0 2>/dev/null | head -c 65536 | while IFS= read -r -d '' backup_file; do
-        if [[ -f "$backup_file" && "$(basename "$backup_file")" =~ ^CLAUDE\.md\.backup\.[0-9]+$ ]]; then
-            backup_files+=("$backup_file")
+    local backup_file
+    for backup_file in "$target_dir"/CLAUDE.md.backup.*; do
+        if [[ -f "$backup_file" && "${backup_file##*/}" =~ ^CLAUDE\.md\.backup\.[0-9]+$ ]]; then
+            backup_files+=("${backup_file##*.}"$'\t'"$backup_file")
         fi
     done
     
-    # Sort by timestamp (newest first)
-    if [[ ${#backup_files[@]} -gt 0 ]]; then
-        IFS=$'\n' backup_files=($(printf '%s\n' "${backup_files[@]}" | sort -t. -k4 -nr))
-        
-        # Keep only the newest ones, remove the rest
-        if [[ ${#backup_files[@]} -gt $max_backups ]]; then
-            for ((i=$max_backups; i<${#backup_files[@]}; i++)); do
-                rm -f "${backup_files[$i]}"
-                ((cleaned_count++))
-                print_status "Cleaned old merge backup: $(basename "${backup_files[$i]}")"
-            done
-        fi
+    # Sort by timestamp (newest first), keep only the newest ones, remove the rest
+    if [[ ${#backup_files[@]} -gt $max_backups ]]; then
+        while IFS=$'\t' read -r _ backup_file; do
+            rm -f "$backup_file"
+            cleaned_count=$((cleaned_count + 1))
+            print_status "Cleaned old merge backup: ${backup_file##*/}"
+        done < <(printf '%s\n' "${backup_files[@]}" | sort -nr | tail -n +$((max_backups + 1)))
     fi
     
     if [[ $cleaned_count -gt 0 ]]; then
@@ -627,14 +610,15 @@ merge_settings_json() {
         print_status "Merging settings using jq..."
         local temp_merged="${target_file}.merged.$$"
         
-        # Merge permissions.allow arrays (remove duplicates) and merge hooks completely
+        # Merge permissions.allow arrays (remove duplicates) and merge hooks completely;
+        # every other key already in the target settings is carried over untouched
         if jq -s '
             .[0] as $target | .[1] as $template |
-            {
-                "permissions": {
+            $target + {
+                "permissions": (($target.permissions // {}) + {
                     "allow": (($target.permissions.allow // []) + ($template.permissions.allow // []) | unique),
                     "deny": ($target.permissions.deny // [])
-                },
+                }),
                 "hooks": ($template.hooks // {})
             }
         ' "$target_file" "$template_file" > "$temp_merged" 2>/dev/null; then
@@ -677,14 +661,12 @@ try:
     template_allows = template.get('permissions', {}).get('allow', [])
     merged_allows = list(set(target_allows + template_allows))
     
-    # Create merged structure
-    merged = {
-        'permissions': {
-            'allow': sorted(merged_allows),
-            'deny': target.get('permissions', {}).get('deny', [])
-        },
-        'hooks': template.get('hooks', {})
-    }
+    # Create merged structure, keeping any other target keys as they are
+    merged = dict(target)
+    merged['permissions'] = dict(target.get('permissions', {}))
+    merged['permissions']['allow'] = sorted(merged_allows)
+    merged['permissions']['deny'] = target.get('permissions', {}).get('deny', [])
+    merged['hooks'] = template.get('hooks', {})
     
     with open('$temp_merged', 'w') as f:
         json.dump(merged, f, indent=2)
@@ -929,7 +911,8 @@ setup_claude_commands() {
         find "$commands_dir" -type d -name "_shared" | while read -r shared_path; do
             if [[ -d "$shared_path" ]]; then
                 # Get the parent directory name (git, test, quality, etc.)
-                local parent_dir=$(basename "$(dirname "$shared_path")")
+                local parent_dir="${shared_path%/*}"
+                parent_dir="${parent_dir##*/}"
                 local target_shared_dir="$shared_dir/$parent_dir"
                 
                 # Create parent directory in shared
@@ -946,17 +929,10 @@ setup_claude_commands() {
         done
         
         # Update references in command files to point to new shared location
+        # (find already filtered to regular files, so hand them to sed in batches)
         print_status "Updating references to shared utilities..."
-        local updated_refs=0
-        find "$commands_dir" -name "*.md" -type f | while read -r cmd_file; do
-            if [[ -f "$cmd_file" ]]; then
-                # Update relative paths from _shared/ to ../../shared/
-                if sed -i.tmp 's|_shared/|../../shared/|g' "$cmd_file" 2>/dev/null; then
-                    rm -f "$cmd_file.tmp"
-                    ((updated_refs++))
-                fi
-            fi
-        done
+        find "$commands_dir" -name "*.md" -type f -exec sed -i.tmp 's|_shared/|../../shared/|g' {} + 2>/dev/null || true
+        find "$commands_dir" -name "*.md.tmp" -type f -delete 2>/dev/null || true
         
         # Verify copy succeeded (with limited find)
         if [[ -d "$commands_dir" ]]; then
@@ -1028,6 +1004,12 @@ main() {
         exit 1
     fi
 
+    # Find templates directory (resolved here so --help needs no templates)
+    if ! TEMPLATES_DIR="$(find_templates_dir)"; then
+        print_error "No valid templates directory found."
+        exit 1
+    fi
+
     # Check for concurrent execution
     check_lock
 
@@ -19,11 +19,13 @@ fi
 # Log the hook execution
 hook_log=".claude/logs/hooks.log"
 mkdir -p "$(dirname "$hook_log")"
-echo "$(date -Iseconds) [INFO] [claude-post-edit-adapter] Triggered for: $file_path" >> "$hook_log"
+# Every entry below belongs to this one event, so stamp them all with the same time
+hook_time=$(date -Iseconds)
+echo "$hook_time [INFO] [claude-post-edit-adapter] Triggered for: $file_path" >> "$hook_log"
 
 # Only process PHP files
 if [[ "$file_path" =~ \.php$ ]]; then
-    echo "$(date -Iseconds) [INFO] [claude-post-edit-adapter] Processing PHP file: $file_path" >> "$hook_log"
+    echo "$hook_time [INFO] [claude-post-edit-adapter] Processing PHP file: $file_path" >> "$hook_log"
     
     # Execute the distributed PHP paradigm post-edit hook
     if [[ -x ".claude/hooks/php-paradigm/post-edit.sh" ]]; then
@@ -31,20 +33,20 @@ if [[ "$file_path" =~ \.php$ ]]; then
         
         # Run the post-edit hook which will auto-fix standards
         if .claude/hooks/php-paradigm/post-edit.sh "$file_path"; then
-            echo "$(date -Iseconds) [INFO] [claude-post-edit-adapter] PHP paradigm auto-fixes applied to: $file_path" >> "$hook_log"
+            echo "$hook_time [INFO] [claude-post-edit-adapter] PHP paradigm auto-fixes applied to: $file_path" >> "$hook_log"
             
             # If file was modified by the hook, inform the user
             if [[ -f "$file_path" ]]; then
                 echo "✅ PHP paradigm standards automatically applied to: $file_path"
             fi
         else
-            echo "$(date -Iseconds) [WARN] [claude-post-edit-adapter] PHP paradigm post-edit hook failed for: $file_path" >> "$hook_log"
+            echo "$hook_time [WARN] [claude-post-edit-adapter] PHP paradigm post-edit hook failed for: $file_path" >> "$hook_log"
         fi
     else
-        echo "$(date -Iseconds) [WARN] [claude-post-edit-adapter] PHP paradigm post-edit hook not found or not executable" >> "$hook_log"
+        echo "$hook_time [WARN] [claude-post-edit-adapter] PHP paradigm post-edit hook not found or not executable" >> "$hook_log"
     fi
 else
-    echo "$(date -Iseconds) [DEBUG] [claude-post-edit-adapter] Skipping non-PHP file: $file_path" >> "$hook_log"
+    echo "$hook_time [DEBUG] [claude-post-edit-adapter] Skipping non-PHP file: $file_path" >> "$hook_log"
 fi
 
 # Return success (non-blocking)
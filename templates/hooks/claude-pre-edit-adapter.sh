@@ -20,21 +20,23 @@ fi
 # Log the hook execution
 hook_log=".claude/logs/hooks.log"
 mkdir -p "$(dirname "$hook_log")"
-echo "$(date -Iseconds) [INFO] [claude-pre-edit-adapter] Triggered for: $file_path" >> "$hook_log"
+# Every entry below belongs to this one event, so stamp them all with the same time
+hook_time=$(date -Iseconds)
+echo "$hook_time [INFO] [claude-pre-edit-adapter] Triggered for: $file_path" >> "$hook_log"
 
 # Only process PHP files
 if [[ "$file_path" =~ \.php$ ]]; then
-    echo "$(date -Iseconds) [INFO] [claude-pre-edit-adapter] Processing PHP file: $file_path" >> "$hook_log"
+    echo "$hook_time [INFO] [claude-pre-edit-adapter] Processing PHP file: $file_path" >> "$hook_log"
     
     # Execute the distributed PHP paradigm pre-edit hook
     if [[ -x ".claude/hooks/php-paradigm/pre-edit.sh" ]]; then
         export FILE_PATH="$file_path"
         .claude/hooks/php-paradigm/pre-edit.sh "$file_path" || true
     else
-        echo "$(date -Iseconds) [WARN] [claude-pre-edit-adapter] PHP paradigm pre-edit hook not found or not executable" >> "$hook_log"
+        echo "$hook_time [WARN] [claude-pre-edit-adapter] PHP paradigm pre-edit hook not found or not executable" >> "$hook_log"
     fi
 else
-    echo "$(date -Iseconds) [DEBUG] [claude-pre-edit-adapter] Skipping non-PHP file: $file_path" >> "$hook_log"
+    echo "$hook_time [DEBUG] [claude-pre-edit-adapter] Skipping non-PHP file: $file_path" >> "$hook_log"
 fi
 
 # Return success (non-blocking)
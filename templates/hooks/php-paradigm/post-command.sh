@@ -134,11 +134,29 @@ esac
 REPORT_FILE=".claude/reports/paradigm-compliance.json"
 mkdir -p "$(dirname "$REPORT_FILE")" 2>/dev/null || true
 
-# Basic compliance check
-TOTAL_PHP_FILES=$(find . -name "*.php" -not -path "./vendor/*" 2>/dev/null | wc -l)
-STRICT_TYPES_FILES=$(find . -name "*.php" -not -path "./vendor/*" -exec grep -l "declare(strict_types=1)" {} \; 2>/dev/null | wc -l)
-TOTAL_TEST_FILES=$(find tests test -name "*Test.php" 2>/dev/null | wc -l || echo 0)
-GROUPED_TEST_FILES=$(find tests test -name "*Test.php" -exec grep -l "#\[Group(" {} \; 2>/dev/null | wc -l || echo 0)
+# Basic compliance check - walk each tree once, then match the fixed marker
+# across all collected files in batched grep calls instead of one grep per file
+PHP_FILES=()
+while IFS= read -r -d '' php_file; do
+    PHP_FILES+=("$php_file")
+done < <(find . -path "./vendor" -prune -o -name "*.php" -type f -print0 2>/dev/null)
+
+TEST_FILES=()
+while IFS= read -r -d '' test_file; do
+    TEST_FILES+=("$test_file")
+done < <(find tests test -name "*Test.php" -type f -print0 2>/dev/null)
+
+TOTAL_PHP_FILES=${#PHP_FILES[@]}
+STRICT_TYPES_FILES=0
+if [[ $TOTAL_PHP_FILES -gt 0 ]]; then
+    STRICT_TYPES_FILES=$(printf '%s\0' "${PHP_FILES[@]}" | xargs -0 grep -l -F "declare(strict_types=1)" 2>/dev/null | wc -l || true)
+fi
+
+TOTAL_TEST_FILES=${#TEST_FILES[@]}
+GROUPED_TEST_FILES=0
+if [[ $TOTAL_TEST_FILES -gt 0 ]]; then
+    GROUPED_TEST_FILES=$(printf '%s\0' "${TEST_FILES[@]}" | xargs -0 grep -l -F "#[Group(" 2>/dev/null | wc -l || true)
+fi
 
 # Calculate compliance percentages
 if [[ $TOTAL_PHP_FILES -gt 0 ]]; then
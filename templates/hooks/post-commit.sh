@@ -27,10 +27,10 @@ print_error() {
     echo -e "${RED}[HOOK]${NC} $1"
 }
 
-# Get project root and commit info
-PROJECT_ROOT="$(git rev-parse --show-toplevel)"
-COMMIT_HASH="$(git rev-parse HEAD)"
+# Get project root and commit info (one rev-parse resolves both)
+{ read -r PROJECT_ROOT; read -r COMMIT_HASH; } < <(git rev-parse --show-toplevel HEAD)
 COMMIT_MSG="$(git log -1 --pretty=%B)"
+PROJECT_NAME="${PROJECT_ROOT##*/}"
 
 cd "$PROJECT_ROOT"
 
@@ -48,82 +48,64 @@ cleanup_old_backups() {
     local cleaned_enhanced=0
     local cleaned_editor=0
     local cleaned_rollback=0
+    local to_remove=()
+    
+    # find evaluates age while walking (-mmin reuses the stat it already did),
+    # so only files past the retention period come back - no per-file stat here.
+    # Ages count in whole hours, so a file goes once it is retention + 1 hours old
+    local retention_minutes=$(( (backup_retention + 1) * 60 - 1 ))
     
     # Clean backups in .claude/backups directory
     if [[ -d ".claude/backups" ]]; then
         # Find and clean old backup files with various patterns
         while IFS= read -r backup_file; do
-            if [[ -f "$backup_file" ]]; then
-                # Calculate age more robustly for different systems
-                local file_age_hours=0
-                if command -v stat >/dev/null 2>&1; then
-                    # macOS and BSD stat
-                    local file_mtime=$(stat -f %m "$backup_file" 2>/dev/null || stat -c %Y "$backup_file" 2>/dev/null || echo 0)
-                    file_age_hours=$(( ($(date +%s) - file_mtime) / 3600 ))
-                fi
-                
-                # Enhanced packages get cleaned immediately
-                if [[ "$backup_file" == *"_ENHANCED.md" ]]; then
-                    rm -f "$backup_file"
-                    ((cleaned_enhanced++))
-                    ((cleaned_count++))
-                # Pre-rollback files with timestamp check
-                elif [[ "$backup_file" == *".pre-rollback."* ]]; then
-                    if [[ $file_age_hours -gt $backup_retention ]]; then
-                        rm -f "$backup_file"
-                        ((cleaned_rollback++))
-                        ((cleaned_count++))
-                    fi
-                # Editor backup files
-                elif [[ "$backup_file" =~ \.(orig|bak)$ ]] || [[ "$backup_file" == *"~" ]]; then
-                    if [[ $file_age_hours -gt $backup_retention ]]; then
-                        rm -f "$backup_file"
-                        ((cleaned_editor++))
-                        ((cleaned_count++))
-                    fi
-                # Standard backup files with timestamps
-                elif [[ $file_age_hours -gt $backup_retention ]]; then
-                    rm -f "$backup_file"
-                    ((cleaned_count++))
-                fi
+            to_remove+=("$backup_file")
+            
+            # Enhanced packages get cleaned immediately
+            if [[ "$backup_file" == *"_ENHANCED.md" ]]; then
+                cleaned_enhanced=$((cleaned_enhanced + 1))
+            # Pre-rollback files
+            elif [[ "$backup_file" == *".pre-rollback."* ]]; then
+                cleaned_rollback=$((cleaned_rollback + 1))
+            # Editor backup files
+            elif [[ "$backup_file" =~ \.(orig|bak)$ ]] || [[ "$backup_file" == *"~" ]]; then
+                cleaned_editor=$((cleaned_editor + 1))
             fi
         done < <(find ".claude/backups" -type f \( \
-            -name "*.backup.*" -o \
-            -name "*.pre-rollback.*" -o \
             -name "*_ENHANCED.md" -o \
-            -name "*.orig" -o \
-            -name "*.bak" -o \
-            -name "*~" \
+            \( \( \
+                -name "*.backup.*" -o \
+                -name "*.pre-rollback.*" -o \
+                -name "*.orig" -o \
+                -name "*.bak" -o \
+                -name "*~" \
+            \) -mmin +"$retention_minutes" \) \
             \) 2>/dev/null)
     fi
     
     # Also clean backup files in project root (outside .claude/backups)
     # Be more careful here - only clean files that match strict backup patterns
     while IFS= read -r backup_file; do
-        if [[ -f "$backup_file" ]]; then
-            local file_age_hours=0
-            if command -v stat >/dev/null 2>&1; then
-                local file_mtime=$(stat -f %m "$backup_file" 2>/dev/null || stat -c %Y "$backup_file" 2>/dev/null || echo 0)
-                file_age_hours=$(( ($(date +%s) - file_mtime) / 3600 ))
-            fi
-            
-            # Enhanced packages get cleaned immediately
-            if [[ "$backup_file" == *"_ENHANCED.md" ]]; then
-                rm -f "$backup_file"
-                ((cleaned_enhanced++))
-                ((cleaned_count++))
-            # Other backups respect retention period
-            elif [[ $file_age_hours -gt $backup_retention ]]; then
-                rm -f "$backup_file"
-                ((cleaned_count++))
-            fi
+        to_remove+=("$backup_file")
+        
+        # Enhanced packages get cleaned immediately
+        if [[ "$backup_file" == *"_ENHANCED.md" ]]; then
+            cleaned_enhanced=$((cleaned_enhanced + 1))
         fi
     done < <(find . -maxdepth 3 -type f \( \
-        -name "*.backup.[0-9]*" -o \
-        -name "*.pre-rollback.[0-9]*" -o \
-        -name "*_ENHANCED.md" \
+        -name "*_ENHANCED.md" -o \
+        \( \( \
+            -name "*.backup.[0-9]*" -o \
+            -name "*.pre-rollback.[0-9]*" \
+        \) -mmin +"$retention_minutes" \) \
         \) -not -path "./.git/*" -not -path "./node_modules/*" -not -path "./.claude/backups/*" 2>/dev/null)
     
+    # Remove everything selected above in batched rm calls rather than one per file
+    if [[ ${#to_remove[@]} -gt 0 ]]; then
+        printf '%s\0' "${to_remove[@]}" | xargs -0 rm -f -- 2>/dev/null || true
+        cleaned_count=${#to_remove[@]}
+    fi
+    
     # Report what was cleaned
     if [[ $cleaned_count -gt 0 ]]; then
         local details=""
@@ -143,11 +125,10 @@ cleanup_old_backups() {
 
 # Update documentation if needed
 update_documentation() {
-    local changed_files=$(git diff-tree --no-commit-id --name-only -r HEAD)
     local docs_updated=false
     
     # Check if any source files changed and docs might need updating
-    if echo "$changed_files" | grep -q -E '\.(js|ts|py|php|go|rs|java|cpp|c)$'; then
+    if echo "$CHANGED_FILES" | grep -q -E '\.(js|ts|py|php|go|rs|java|cpp|c)$'; then
         if [[ -n "$DOCS_COMMAND" ]] && command -v ${DOCS_COMMAND%% *} >/dev/null 2>&1; then
             print_status "Source files changed, updating documentation..."
             if $DOCS_COMMAND >/dev/null 2>&1; then
@@ -164,14 +145,15 @@ update_documentation() {
 
 # Send notifications if configured
 send_notifications() {
-    local commit_short=$(echo "$COMMIT_HASH" | cut -c1-8)
-    local commit_subject=$(echo "$COMMIT_MSG" | head -n1)
+    local commit_short="${COMMIT_HASH:0:8}"
+    local commit_subject="${COMMIT_MSG%%$'\n'*}"
+    local pids=()
     
     # Webhook notification
     if [[ -n "$CLAUDE_HOOKS_WEBHOOK_URL" ]]; then
         local payload=$(cat <<EOF
 {
-    "project": "$(basename "$PROJECT_ROOT")",
+    "project": "$PROJECT_NAME",
     "commit": "$commit_short",
     "message": "$commit_subject",
     "author": "$(git log -1 --pretty=%an)",
@@ -184,7 +166,8 @@ EOF
             curl -X POST "$CLAUDE_HOOKS_WEBHOOK_URL" \
                 -H "Content-Type: application/json" \
                 -d "$payload" \
-                >/dev/null 2>&1 || true
+                >/dev/null 2>&1 &
+            pids+=($!)
             print_status "Webhook notification sent"
         fi
     fi
@@ -193,7 +176,7 @@ EOF
     if [[ -n "$CLAUDE_HOOKS_SLACK_WEBHOOK" ]]; then
         local slack_payload=$(cat <<EOF
 {
-    "text": "New commit in $(basename "$PROJECT_ROOT"): $commit_subject ($commit_short)"
+    "text": "New commit in $PROJECT_NAME: $commit_subject ($commit_short)"
 }
 EOF
 )
@@ -202,10 +185,16 @@ EOF
             curl -X POST "$CLAUDE_HOOKS_SLACK_WEBHOOK" \
                 -H "Content-Type: application/json" \
                 -d "$slack_payload" \
-                >/dev/null 2>&1 || true
+                >/dev/null 2>&1 &
+            pids+=($!)
             print_status "Slack notification sent"
         fi
     fi
+    
+    # Requests run concurrently; wait so the hook doesn't exit mid-request
+    if [[ ${#pids[@]} -gt 0 ]]; then
+        wait "${pids[@]}" 2>/dev/null || true
+    fi
 }
 
 # Update commit statistics
@@ -228,7 +217,7 @@ update_stats() {
     "total_commits": $commit_count,
     "last_commit": "$COMMIT_HASH",
     "last_commit_date": "$(date -u +%Y-%m-%dT%H:%M:%SZ)",
-    "project": "$(basename "$PROJECT_ROOT")"
+    "project": "$PROJECT_NAME"
 }
 EOF
     
@@ -243,6 +232,9 @@ main() {
         return 0
     fi
     
+    # Files in this commit, read once for the docs check and the summary
+    CHANGED_FILES="$(git diff-tree --no-commit-id --name-only -r HEAD)"
+    
     # Clean up old backups
     cleanup_old_backups
     
@@ -260,8 +252,8 @@ main() {
     print_success "Post-commit processing completed"
     
     # Show helpful information
-    print_status "Commit: $(echo "$COMMIT_HASH" | cut -c1-8)"
-    print_status "Files changed: $(git diff-tree --no-commit-id --name-only -r HEAD | wc -l | xargs)"
+    print_status "Commit: ${COMMIT_HASH:0:8}"
+    print_status "Files changed: $(printf '%s' "$CHANGED_FILES" | grep -c '^')"
     
     return 0
 }
@@ -27,8 +27,9 @@ print_error() {
     echo -e "${RED}[HOOK]${NC} $1"
 }
 
-# Get project root
-PROJECT_ROOT="$(git rev-parse --show-toplevel)"
+# Get project root and merge info (one rev-parse resolves both)
+{ read -r PROJECT_ROOT; read -r MERGE_COMMIT; } < <(git rev-parse --show-toplevel HEAD)
+PROJECT_NAME="${PROJECT_ROOT##*/}"
 cd "$PROJECT_ROOT"
 
 # Load project configuration if it exists
@@ -45,8 +46,24 @@ print_status "Running post-merge cleanup and updates..."
 update_dependencies() {
     local files_changed=$(git diff-tree --no-commit-id --name-only -r HEAD^1 HEAD 2>/dev/null || true)
     local deps_updated=false
+    local npm_changed=false
+    local pip_changed=false
+    local cargo_changed=false
+    local go_changed=false
+    local composer_changed=false
     
-    if echo "$files_changed" | grep -q "package\.json"; then
+    # Classify changed files in one pass instead of one grep per manifest
+    while IFS= read -r changed_file; do
+        case "$changed_file" in
+            *package.json*) npm_changed=true ;;
+            *requirements.txt*) pip_changed=true ;;
+            *Cargo.toml*) cargo_changed=true ;;
+            *go.mod*) go_changed=true ;;
+            *composer.json*) composer_changed=true ;;
+        esac
+    done <<< "$files_changed"
+    
+    if [[ "$npm_changed" == "true" ]]; then
         if command -v npm >/dev/null 2>&1; then
             print_status "package.json changed, updating npm dependencies..."
             if npm install >/dev/null 2>&1; then
@@ -58,7 +75,7 @@ update_dependencies() {
         fi
     fi
     
-    if echo "$files_changed" | grep -q "requirements\.txt"; then
+    if [[ "$pip_changed" == "true" ]]; then
         if command -v pip >/dev/null 2>&1; then
             print_status "requirements.txt changed, updating pip dependencies..."
             if pip install -r requirements.txt >/dev/null 2>&1; then
@@ -70,7 +87,7 @@ update_dependencies() {
         fi
     fi
     
-    if echo "$files_changed" | grep -q "Cargo\.toml"; then
+    if [[ "$cargo_changed" == "true" ]]; then
         if command -v cargo >/dev/null 2>&1; then
             print_status "Cargo.toml changed, updating Rust dependencies..."
             if cargo check >/dev/null 2>&1; then
@@ -82,7 +99,7 @@ update_dependencies() {
         fi
     fi
     
-    if echo "$files_changed" | grep -q "go\.mod"; then
+    if [[ "$go_changed" == "true" ]]; then
         if command -v go >/dev/null 2>&1; then
             print_status "go.mod changed, updating Go dependencies..."
             if go mod tidy >/dev/null 2>&1; then
@@ -94,7 +111,7 @@ update_dependencies() {
         fi
     fi
     
-    if echo "$files_changed" | grep -q "composer\.json"; then
+    if [[ "$composer_changed" == "true" ]]; then
         if command -v composer >/dev/null 2>&1; then
             print_status "composer.json changed, updating PHP dependencies..."
             if composer install >/dev/null 2>&1; then
@@ -156,17 +173,15 @@ update_project_metadata() {
         mkdir -p ".claude/stats"
     fi
     
-    local merge_commit=$(git rev-parse HEAD)
     local merge_date=$(date -u +%Y-%m-%dT%H:%M:%SZ)
-    local merged_branch=$(git log --merges -n 1 --pretty=format:"%s" | sed 's/Merge branch //' | sed "s/'//g" | awk '{print $1}' || echo "unknown")
     
     cat > "$merge_info_file" << EOF
 {
-    "merge_commit": "$merge_commit",
+    "merge_commit": "$MERGE_COMMIT",
     "merge_date": "$merge_date",
-    "merged_branch": "$merged_branch",
+    "merged_branch": "$MERGED_BRANCH",
     "squash_merge": $([[ "$SQUASH_MERGE" == "1" ]] && echo "true" || echo "false"),
-    "project": "$(basename "$PROJECT_ROOT")"
+    "project": "$PROJECT_NAME"
 }
 EOF
     
@@ -175,19 +190,16 @@ EOF
 
 # Clean up temporary files and caches
 cleanup_after_merge() {
-    # Clean up common temporary files
-    local temp_patterns=(
-        "*.tmp"
-        "*.temp"
-        ".DS_Store"
-        "Thumbs.db"
-        "*.orig"
-        "*.rej"
-    )
-    
-    for pattern in "${temp_patterns[@]}"; do
-        find . -name "$pattern" -type f -delete 2>/dev/null || true
-    done
+    # Clean up common temporary files and Python bytecode in a single tree walk
+    find . -type f \( \
+        -name "*.tmp" -o \
+        -name "*.temp" -o \
+        -name ".DS_Store" -o \
+        -name "Thumbs.db" -o \
+        -name "*.orig" -o \
+        -name "*.rej" -o \
+        -name "*.pyc" \
+        \) -delete 2>/dev/null || true
     
     # Clean up node_modules/.cache if it exists
     if [[ -d "node_modules/.cache" ]]; then
@@ -195,8 +207,7 @@ cleanup_after_merge() {
     fi
     
     # Clean up Python cache
-    find . -name "__pycache__" -type d -exec rm -rf {} + 2>/dev/null || true
-    find . -name "*.pyc" -type f -delete 2>/dev/null || true
+    find . -name "__pycache__" -type d -prune -exec rm -rf {} + 2>/dev/null || true
     
     print_status "Temporary files cleaned up"
 }
@@ -204,17 +215,14 @@ cleanup_after_merge() {
 # Send merge notifications
 send_merge_notifications() {
     if [[ "${CLAUDE_HOOKS_NOTIFICATIONS:-false}" == "true" ]]; then
-        local merge_commit=$(git rev-parse --short HEAD)
-        local merged_branch=$(git log --merges -n 1 --pretty=format:"%s" | sed 's/Merge branch //' | sed "s/'//g" | awk '{print $1}' || echo "unknown")
-        
         # Webhook notification
         if [[ -n "$CLAUDE_HOOKS_WEBHOOK_URL" ]]; then
             local payload=$(cat <<EOF
 {
     "event": "merge",
-    "project": "$(basename "$PROJECT_ROOT")",
-    "commit": "$merge_commit",
-    "merged_branch": "$merged_branch",
+    "project": "$PROJECT_NAME",
+    "commit": "${MERGE_COMMIT:0:7}",
+    "merged_branch": "$MERGED_BRANCH",
     "squash_merge": $([[ "$SQUASH_MERGE" == "1" ]] && echo "true" || echo "false"),
     "timestamp": "$(date -u +%Y-%m-%dT%H:%M:%SZ)"
 }
@@ -257,6 +265,9 @@ main() {
         exit_code=1
     fi
     
+    # Branch name for the metadata and notification records
+    MERGED_BRANCH=$(git log --merges -n 1 --pretty=format:"%s" | sed 's/Merge branch //' | sed "s/'//g" | awk '{print $1}' || echo "unknown")
+    
     # Update metadata (this should not fail)
     update_project_metadata
     
@@ -275,7 +286,7 @@ main() {
     
     # Show helpful information
     print_status "Current branch: $(git rev-parse --abbrev-ref HEAD)"
-    print_status "Last commit: $(git rev-parse --short HEAD)"
+    print_status "Last commit: ${MERGE_COMMIT:0:7}"
     
     return $exit_code
 }
@@ -38,6 +38,9 @@ fi
 
 print_status "Running pre-commit quality checks..."
 
+# Staged paths matching this are backup artifacts that must never be committed
+BACKUP_FILE_REGEX='\.(backup|pre-rollback)\.[0-9]+|_ENHANCED\.md$|\.(bak|orig)$|~$'
+
 # Check if CLAUDE.md exists and has mandatory sections
 check_claude_md() {
     if [[ -f "CLAUDE.md" ]]; then
@@ -102,12 +105,7 @@ detect_and_unstage_backups() {
     # Get list of staged files and check for backup patterns
     while IFS= read -r staged_file; do
         # Check if file matches backup patterns
-        if [[ "$staged_file" =~ \.backup\.[0-9]+ ]] || 
-           [[ "$staged_file" =~ \.pre-rollback\.[0-9]+ ]] || 
-           [[ "$staged_file" == *"_ENHANCED.md" ]] || 
-           [[ "$staged_file" =~ \.(bak|orig)$ ]] || 
-           [[ "$staged_file" == *"~" ]] || 
-           [[ "$staged_file" =~ \.backup\.[0-9]{8}-[0-9]{6} ]]; then
+        if [[ "$staged_file" =~ $BACKUP_FILE_REGEX ]]; then
             staged_backups+=("$staged_file")
             backup_files_found=true
         fi
@@ -115,14 +113,10 @@ detect_and_unstage_backups() {
     
     if [[ "$backup_files_found" == true ]]; then
         print_warning "Backup files detected in staging area:"
-        for file in "${staged_backups[@]}"; do
-            echo "  - $file"
-        done
+        printf '  - %s\n' "${staged_backups[@]}"
         
-        # Unstage backup files
-        for file in "${staged_backups[@]}"; do
-            git reset HEAD -- "$file" 2>/dev/null || true
-        done
+        # Unstage backup files - one git process handles every path
+        git reset -q HEAD -- "${staged_backups[@]}" 2>/dev/null || true
         
         print_success "Backup files automatically unstaged (${#staged_backups[@]} files)"
         print_status "These files remain in your working directory but won't be committed"
@@ -131,27 +125,39 @@ detect_and_unstage_backups() {
         if [[ ! -d ".claude/logs" ]]; then
             mkdir -p ".claude/logs"
         fi
-        echo "[$(date '+%Y-%m-%d %H:%M:%S')] Unstaged backup files: ${staged_backups[*]}" >> ".claude/logs/backup-prevention.log"
+        local log_file=".claude/logs/backup-prevention.log"
+        echo "[$(date '+%Y-%m-%d %H:%M:%S')] Unstaged backup files: ${staged_backups[*]}" >> "$log_file"
+        
+        # Keep only the most recent entries so the log can't grow without bound
+        local log_limit="${CLAUDE_HOOKS_BACKUP_LOG_LINES:-1000}"
+        if [[ $(wc -l < "$log_file") -gt $log_limit ]]; then
+            tail -n "$log_limit" "$log_file" > "$log_file.tmp" && mv "$log_file.tmp" "$log_file"
+        fi
     fi
 }
 
 # Check for secrets or sensitive data
 check_secrets() {
-    local files_to_check=$(git diff --cached --name-only)
-    local secrets_found=false
+    local files_to_check=()
+    
+    while IFS= read -r -d '' file; do
+        if [[ -f "$file" ]]; then
+            files_to_check+=("$file")
+        fi
+    done < <(git diff --cached --name-only -z)
     
-    if [[ -n "$files_to_check" ]]; then
-        for file in $files_to_check; do
-            if [[ -f "$file" ]]; then
-                # Check for common secret patterns
-                if grep -q -E "(api_key|password|secret|token|private_key)" "$file" 2>/dev/null; then
-                    print_warning "Potential secret detected in $file - please review"
-                fi
-                
-                # Check for common secret file patterns
-                if [[ "$file" =~ \.(env|key|pem|p12)$ ]]; then
-                    print_warning "Sensitive file type detected: $file"
-                fi
+    if [[ ${#files_to_check[@]} -gt 0 ]]; then
+        # Check for common secret patterns - scan files in batched grep calls
+        # instead of spawning one grep per file
+        while IFS= read -r file; do
+            print_warning "Potential secret detected in $file - please review"
+        done < <(printf '%s\0' "${files_to_check[@]}" | \
+            xargs -0 grep -l -E "(api_key|password|secret|token|private_key)" -- 2>/dev/null)
+        
+        # Check for common secret file patterns
+        for file in "${files_to_check[@]}"; do
+            if [[ "$file" =~ \.(env|key|pem|p12)$ ]]; then
+                print_warning "Sensitive file type detected: $file"
             fi
         done
     fi
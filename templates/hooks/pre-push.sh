@@ -102,10 +102,32 @@ run_security_check() {
         local changed_files=$(git diff-tree --no-commit-id --name-only -r $COMMIT_RANGE 2>/dev/null || true)
         
         if [[ -n "$changed_files" ]]; then
+            # Stream the range's patches once instead of running git log -p per
+            # file; awk loads the changed paths first (from a file, not argv, so
+            # large pushes can't overflow the argument list), tracks the current
+            # file and prints each changed one whose path or patch lines match a
+            # secret pattern
+            local secret_files
+            if ! secret_files=$(git log -p --format= $COMMIT_RANGE | awk '
+                NR == FNR { want[$0]; next }
+                /^diff --git / { file = ""; next }
+                /^\+\+\+ / {
+                    file = ($2 == "/dev/null") ? "" : substr($0, 7)
+                    if (!(file in want)) file = ""
+                    if (file != "" && !(file in seen) && file ~ /(api_key|password|secret|token|private_key)/) { seen[file]; print file }
+                    next
+                }
+                file != "" && !(file in seen) && /(api_key|password|secret|token|private_key)/ { seen[file]; print file }
+            ' <(printf '%s\n' "$changed_files") -; exit "${PIPESTATUS[0]}"); then
+                print_error "Could not read commit history for $COMMIT_RANGE - cannot verify it is free of secrets"
+                security_issues=true
+            fi
+            secret_files=$'\n'$secret_files$'\n'
+            
             for file in $changed_files; do
                 if [[ -f "$file" ]]; then
                     # Check for API keys, passwords, etc.
-                    if git log --oneline -p $COMMIT_RANGE -- "$file" | grep -q -E "(api_key|password|secret|token|private_key)" 2>/dev/null; then
+                    if [[ "$secret_files" == *$'\n'"$file"$'\n'* ]]; then
                         print_error "Potential secret detected in commit history for $file"
                         security_issues=true
                     fi
@@ -193,7 +215,12 @@ check_branch_protection() {
     
     # Check for proper commit message format
     if [[ -n "$COMMIT_RANGE" ]]; then
-        local invalid_commits=$(git log --oneline --pretty=format:"%s" $COMMIT_RANGE | grep -v -E "^(feat|fix|docs|style|refactor|test|chore)(\(.+\))?: .+" || true)
+        # Filter subjects as they stream out of git log and keep only the first
+        # 20 offenders, so large ranges are never held in memory in full
+        local invalid_commits=$(git log --pretty=format:"%s" $COMMIT_RANGE | awk -v max=20 '
+            !/^(feat|fix|docs|style|refactor|test|chore)(\(.+\))?: .+/ { if (++n <= max) print }
+            END { if (n > max) printf "... and %d more\n", n - max }
+        ' || true)
         if [[ -n "$invalid_commits" ]]; then
             print_warning "Some commits don't follow conventional commit format:"
             echo "$invalid_commits"
@@ -203,6 +230,46 @@ check_branch_protection() {
     return 0
 }
 
+# Cache key for the test/build gates: the tree being verified plus the
+# commands and switches that verify it. Empty when the worktree is dirty,
+# since tests then run against files that are not part of HEAD, and when an
+# enabled gate's tool is missing, since that gate is skipped rather than run.
+# Ignored files (node_modules, .env, build output) are not part of the key, so
+# the cache is opt-in via CLAUDE_HOOKS_PREPUSH_CACHE.
+verification_cache_key() {
+    if [[ -n "$(git status --porcelain 2>/dev/null)" ]]; then
+        return 0
+    fi
+    
+    if [[ "${CLAUDE_HOOKS_RUN_TESTS_PREPUSH:-true}" == "true" && -n "$TEST_COMMAND" ]] && \
+        ! command -v ${TEST_COMMAND%% *} >/dev/null 2>&1; then
+        return 0
+    fi
+    
+    if [[ "${CLAUDE_HOOKS_RUN_BUILD_PREPUSH:-true}" == "true" && -n "$BUILD_COMMAND" ]] && \
+        ! command -v ${BUILD_COMMAND%% *} >/dev/null 2>&1; then
+        return 0
+    fi
+    
+    printf '%s\n' \
+        "$(git rev-parse HEAD^{tree} 2>/dev/null)" \
+        "$TEST_COMMAND" "${CLAUDE_HOOKS_RUN_TESTS_PREPUSH:-true}" \
+        "$BUILD_COMMAND" "${CLAUDE_HOOKS_RUN_BUILD_PREPUSH:-true}" | git hash-object --stdin
+}
+
+# Explain how to proceed when the push is blocked
+print_push_blocked() {
+    print_error "Pre-push checks failed! Push blocked."
+    print_status ""
+    print_status "To bypass these checks (not recommended):"
+    print_status "git push --no-verify"
+    print_status ""
+    print_status "To disable specific checks, set environment variables:"
+    print_status "CLAUDE_HOOKS_RUN_TESTS_PREPUSH=false"
+    print_status "CLAUDE_HOOKS_RUN_BUILD_PREPUSH=false"
+    print_status "CLAUDE_HOOKS_PROTECT_MAIN=false"
+}
+
 # Main execution
 main() {
     local exit_code=0
@@ -215,6 +282,13 @@ main() {
     
     print_status "Pushing to: $remote ($url)"
     
+    # Check branch protection rules first - it is the cheapest gate, and a
+    # blocked branch makes the security scan, tests and build pointless
+    if ! check_branch_protection; then
+        print_push_blocked
+        return 1
+    fi
+    
     # Run security checks (mandatory)
     if ! run_security_check; then
         exit_code=1
@@ -225,41 +299,49 @@ main() {
         exit_code=1
     fi
     
-    # Run tests (can be disabled)
-    if [[ "${CLAUDE_HOOKS_RUN_TESTS_PREPUSH:-true}" == "true" ]]; then
-        if ! run_full_tests; then
-            exit_code=1
-        fi
-    else
-        print_status "Pre-push tests disabled"
+    # Skip tests and build when this exact tree already passed them
+    local cache_file="$(git rev-parse --git-dir)/claude-prepush-verified"
+    local cache_key=""
+    if [[ "${CLAUDE_HOOKS_PREPUSH_CACHE:-false}" == "true" ]]; then
+        cache_key=$(verification_cache_key)
     fi
     
-    # Run build check (can be disabled)
-    if [[ "${CLAUDE_HOOKS_RUN_BUILD_PREPUSH:-true}" == "true" ]]; then
-        if ! run_build_check; then
+    if [[ -n "$cache_key" && -f "$cache_file" && "$(cat "$cache_file" 2>/dev/null)" == "$cache_key" ]]; then
+        print_status "Tests and build already passed for this tree - skipping"
+    else
+        local gates_passed=true
+        
+        # Run tests (can be disabled)
+        if [[ "${CLAUDE_HOOKS_RUN_TESTS_PREPUSH:-true}" == "true" ]]; then
+            if ! run_full_tests; then
+                gates_passed=false
+            fi
+        else
+            print_status "Pre-push tests disabled"
+        fi
+        
+        # Run build check (can be disabled)
+        if [[ "${CLAUDE_HOOKS_RUN_BUILD_PREPUSH:-true}" == "true" ]]; then
+            if ! run_build_check; then
+                gates_passed=false
+            fi
+        else
+            print_status "Pre-push build check disabled"
+        fi
+        
+        if [[ "$gates_passed" == "true" ]]; then
+            if [[ -n "$cache_key" ]]; then
+                echo "$cache_key" > "$cache_file"
+            fi
+        else
             exit_code=1
         fi
-    else
-        print_status "Pre-push build check disabled"
-    fi
-    
-    # Check branch protection rules
-    if ! check_branch_protection; then
-        exit_code=1
     fi
     
     if [[ $exit_code -eq 0 ]]; then
         print_success "All pre-push checks passed! Ready to push."
     else
-        print_error "Pre-push checks failed! Push blocked."
-        print_status ""
-        print_status "To bypass these checks (not recommended):"
-        print_status "git push --no-verify"
-        print_status ""
-        print_status "To disable specific checks, set environment variables:"
-        print_status "CLAUDE_HOOKS_RUN_TESTS_PREPUSH=false"
-        print_status "CLAUDE_HOOKS_RUN_BUILD_PREPUSH=false"
-        print_status "CLAUDE_HOOKS_PROTECT_MAIN=false"
+        print_push_blocked
     fi
     
     return $exit_code